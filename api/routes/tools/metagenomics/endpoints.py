@@ -27,6 +27,8 @@ class MetagenomicsRequest(BaseModel):
 
 router = APIRouter(prefix="/metagenomics")
 
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
 @router.post("/", response_model=AnalysisResponse)
 async def analyze_metagenome(request: MetagenomicsRequest):
     """Analyze metagenomic FASTA for microbial taxa."""
@@ -54,13 +56,17 @@ async def download_csv(file: UploadFile = File(None), fasta_text: str = Form("")
     """Generate and download CSV of analysis results."""
     try:
         if file:
-            fasta_content = (await file.read()).decode("utf-8")
+            # Parse the upload chunk by chunk instead of buffering and decoding it whole
+            parser = functions.FastaParser()
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                parser.feed(chunk)
+            sequences = parser.close()
         elif fasta_text.strip():
-            fasta_content = fasta_text
+            sequences = functions.parse_fasta(fasta_text)
         else:
             raise HTTPException(status_code=400, detail="Provide FASTA file or text")
 
-        _, _, details_df = functions.profile_taxa(fasta_content)
+        _, _, details_df = functions.profile_sequences(sequences)
         if details_df.empty:
             raise HTTPException(status_code=400, detail="No taxa identified for CSV export")
 
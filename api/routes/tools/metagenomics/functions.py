@@ -1,39 +1,68 @@
 from typing import List, Dict, Tuple
 from collections import defaultdict
-import re
 import pandas as pd
 import numpy as np
 
-def parse_fasta(fasta: str) -> List[str]:
-    """Parse FASTA string, skipping invalid sequences."""
-    sequences = []
-    current_seq = []
-    lines = fasta.strip().split('\n')
-    header = False
-    
-    for line in lines:
+# Byte translation table that uppercases ASCII letters
+_UPPER_TABLE = bytes(range(256)).upper()
+
+class FastaParser:
+    """Incremental FASTA parser; feed() it raw byte chunks, then close() for the valid sequences."""
+
+    def __init__(self):
+        self.sequences = []
+        self._current_seq = bytearray()
+        self._header = False
+        self._partial_line = bytearray()
+
+    def _flush(self):
+        # Uppercase in one pass; the record is valid if deleting ATCGN leaves nothing
+        seq = self._current_seq.translate(_UPPER_TABLE)
+        if not seq.translate(None, b"ATCGN"):
+            self.sequences.append(seq.decode("ascii"))
+        self._current_seq.clear()
+
+    def _feed_line(self, line: bytes):
         line = line.strip()
         if not line:
-            continue
-        if line.startswith('>'):
-            if current_seq:
-                seq = ''.join(current_seq).upper()
-                if re.match(r'^[ATCGN]+$', seq):
-                    sequences.append(seq)
-                current_seq = []
-            header = True
-        elif header:
-            current_seq.append(line)
-    
-    if current_seq:
-        seq = ''.join(current_seq).upper()
-        if re.match(r'^[ATCGN]+$', seq):
-            sequences.append(seq)
-    
-    valid_sequences = [seq for seq in sequences if len(seq) >= 21]
-    if not valid_sequences:
-        raise ValueError("No valid sequences found (min length 21bp, only ATCGN allowed)")
-    return valid_sequences
+            return
+        if line.startswith(b">"):
+            if self._current_seq:
+                self._flush()
+            self._header = True
+        elif self._header:
+            self._current_seq += line
+
+    def feed(self, chunk: bytes):
+        # A chunk may end mid-line; the unfinished tail is appended to, never re-split,
+        # so a line spanning many chunks is only copied once
+        last_newline = chunk.rfind(b"\n")
+        if last_newline < 0:
+            self._partial_line += chunk
+            return
+        first_newline = chunk.find(b"\n")
+        self._partial_line += chunk[:first_newline]
+        self._feed_line(self._partial_line)
+        for line in chunk[first_newline + 1:last_newline].split(b"\n"):
+            self._feed_line(line)
+        self._partial_line = bytearray(chunk[last_newline + 1:])
+
+    def close(self) -> List[str]:
+        self._feed_line(self._partial_line)
+        self._partial_line = bytearray()
+        if self._current_seq:
+            self._flush()
+
+        valid_sequences = [seq for seq in self.sequences if len(seq) >= 21]
+        if not valid_sequences:
+            raise ValueError("No valid sequences found (min length 21bp, only ATCGN allowed)")
+        return valid_sequences
+
+def parse_fasta(fasta: str) -> List[str]:
+    """Parse FASTA string, skipping invalid sequences."""
+    parser = FastaParser()
+    parser.feed(fasta.strip().encode("utf-8"))
+    return parser.close()
 
 def get_kmers(sequence: str, k: int = 21) -> List[str]:
     """Extract k-mers, skipping ambiguous regions."""
@@ -87,7 +116,10 @@ def hamming_distance(s1: str, s2: str) -> int:
 
 def profile_taxa(fasta: str) -> Tuple[List[Dict[str, float]], Dict[str, int], pd.DataFrame]:
     """Profile taxa with approximate k-mer matching."""
-    sequences = parse_fasta(fasta)
+    return profile_sequences(parse_fasta(fasta))
+
+def profile_sequences(sequences: List[str]) -> Tuple[List[Dict[str, float]], Dict[str, int], pd.DataFrame]:
+    """Profile taxa of already-parsed sequences."""
     kmer_db = mock_reference_db()
     taxa_counts = defaultdict(int)
     total_kmers = 0
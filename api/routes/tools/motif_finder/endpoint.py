@@ -15,11 +15,11 @@ def find_motifs(fasta: str):
         raise HTTPException(status_code=400, detail="At least two sequences required")
     
     motif_length = functions.estimate_max_motif_length(sequences)
-    motifs, score = functions.gibbs_sampling(sequences, motif_length)
+    motifs, score, pwm = functions.gibbs_sampling(sequences, motif_length)
     if not motifs:
         raise HTTPException(status_code=404, detail="No motifs found")
     
-    consensus = functions.motifs_to_consensus(motifs)
+    consensus = functions.motifs_to_consensus(motifs, pwm)
     positions = functions.find_motif_positions(sequences, consensus)
     
     return {
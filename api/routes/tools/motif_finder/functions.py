@@ -1,7 +1,14 @@
-from typing import List, Tuple, Dict
-import random
+from typing import List, Tuple, Dict, Optional
 from collections import Counter
-import math
+
+import numpy as np
+
+BASES = "ACGT"
+
+# Byte -> base code lookup; anything outside ACGT maps to 4
+BASE_CODES = np.full(256, 4, dtype=np.uint8)
+for _i, _base in enumerate(BASES):
+    BASE_CODES[ord(_base)] = _i
 
 # Parse FASTA sequences
 def parse_fasta(fasta: str) -> List[str]:
@@ -26,80 +33,93 @@ def background_frequencies(sequences: List[str]) -> Dict[str, float]:
     total = sum(counter.values())
     return {base: count / total for base, count in counter.items() if base in "ACGT"}
 
-# Build position weight matrix (PWM) from motifs
-def build_pwm(motifs: List[str], pseudocount: float = 0.01) -> List[Dict[str, float]]:
-    pwm = []
+# Count bases per motif position, columns ordered as BASES
+def motifs_to_counts(motifs: List[str]) -> np.ndarray:
     motif_length = len(motifs[0])
-    for pos in range(motif_length):
-        counter = Counter(motif[pos] for motif in motifs)
-        total = sum(counter.values()) + 4 * pseudocount
-        pwm.append({
-            'A': (counter.get('A', 0) + pseudocount) / total,
-            'C': (counter.get('C', 0) + pseudocount) / total,
-            'G': (counter.get('G', 0) + pseudocount) / total,
-            'T': (counter.get('T', 0) + pseudocount) / total
-        })
-    return pwm
+    raw = np.frombuffer("".join(motifs).encode("ascii", "replace"), dtype=np.uint8)
+    codes = BASE_CODES[raw].reshape(len(motifs), motif_length)
+    flat = (np.arange(motif_length) * 5 + codes).ravel()
+    counts = np.bincount(flat, minlength=motif_length * 5).reshape(motif_length, 5)
+    return counts[:, :4].astype(np.int32)
+
+# Turn per-position base counts from n_motifs motifs into a PWM
+def pwm_from_counts(counts: np.ndarray, n_motifs: int, pseudocount: float = 0.01) -> np.ndarray:
+    total = n_motifs + 4 * pseudocount
+    return (counts + pseudocount) / total
+
+# Build position weight matrix (PWM) from motifs, shape (motif_length, 4)
+def build_pwm(motifs: List[str], pseudocount: float = 0.01) -> np.ndarray:
+    return pwm_from_counts(motifs_to_counts(motifs), len(motifs), pseudocount)
+
+# Encode a sequence as base codes (A, C, G, T -> 0..3, anything else -> 4)
+def encode_sequence(seq: str) -> np.ndarray:
+    return BASE_CODES[np.frombuffer(seq.encode("ascii", "replace"), dtype=np.uint8)]
 
-# Score a motif against PWM
-def score_motif(motif: str, pwm: List[Dict[str, float]], background: Dict[str, float]) -> float:
-    score = 0.0
-    for i, base in enumerate(motif):
-        if base in pwm[i]:
-            score += math.log2(pwm[i][base] / background.get(base, 0.01))
-    return score
+# Log-odds of a PWM against background frequencies, shape (motif_length, 5);
+# the last column scores unknown bases as 0
+def log_odds_matrix(pwm: np.ndarray, background: np.ndarray) -> np.ndarray:
+    log_odds = np.zeros((len(pwm), 5))
+    log_odds[:, :4] = np.log2(pwm / background)
+    return log_odds
+
+# Score encoded motifs against log-odds; codes may be one motif or a stack of them
+def score_motif(codes: np.ndarray, log_odds: np.ndarray) -> np.ndarray:
+    return log_odds[np.arange(len(log_odds)), codes].sum(axis=-1)
 
 # Gibbs Sampling for motif finding
-def gibbs_sampling(sequences: List[str], motif_length: int, iterations: int = 200) -> Tuple[List[str], float]:
+def gibbs_sampling(sequences: List[str], motif_length: int, iterations: int = 200, rng: Optional[np.random.Generator] = None) -> Tuple[List[str], float, Optional[np.ndarray]]:
     if not sequences or motif_length < 1:
-        return [], 0.0
+        return [], 0.0, None
+    if rng is None:
+        rng = np.random.default_rng()
     
     seq_lengths = [len(seq) for seq in sequences]
-    positions = [random.randint(0, max(0, l - motif_length)) for l in seq_lengths]
+    positions = [int(rng.integers(0, max(0, l - motif_length) + 1)) for l in seq_lengths]
     motifs = [sequences[i][pos:pos + motif_length] for i, pos in enumerate(positions) if pos + motif_length <= len(sequences[i])]
     
     if len(motifs) != len(sequences):
-        return [], 0.0
+        return [], 0.0, None
     
     background = background_frequencies(sequences)
+    bg_arr = np.array([background.get(base, 0.01) for base in BASES])
+    seq_codes = [encode_sequence(seq) for seq in sequences]
+    motif_codes = np.stack([seq_codes[i][pos:pos + motif_length] for i, pos in enumerate(positions)])
     best_motifs = motifs[:]
     best_score = -float("inf")
+    # Running per-position counts, updated as motifs are swapped in and out
+    counts = motifs_to_counts(motifs)
+    n_motifs = len(motifs)
+    best_pwm = pwm_from_counts(counts, n_motifs)
+    
+    # Draw every held-out index and sampling uniform up front
+    idxs = rng.integers(0, len(sequences), size=iterations)
+    uniforms = rng.random(iterations)
     
-    for _ in range(iterations):
-        idx = random.randint(0, len(sequences) - 1)
-        other_motifs = motifs[:idx] + motifs[idx + 1:]
-        pwm = build_pwm(other_motifs)
+    for it in range(iterations):
+        idx = idxs[it]
+        other_counts = counts - motifs_to_counts([motifs[idx]])
+        log_odds = log_odds_matrix(pwm_from_counts(other_counts, n_motifs - 1), bg_arr)
         
-        scores = []
-        possible_positions = []
         seq = sequences[idx]
-        for pos in range(max(0, len(seq) - motif_length + 1)):
-            motif = seq[pos:pos + motif_length]
-            if len(motif) == motif_length:
-                score = score_motif(motif, pwm, background)
-                scores.append(score)
-                possible_positions.append(pos)
-        
-        if not scores:
-            continue
+        windows = np.lib.stride_tricks.sliding_window_view(seq_codes[idx], motif_length)
+        scores = score_motif(windows, log_odds)
         
-        max_score = max(scores)
-        scores = [math.exp(s - max_score) for s in scores]
-        total = sum(scores)
-        if total == 0:
-            continue
-        probs = [s / total for s in scores]
+        weights = np.exp(scores - scores.max())
+        cum_probs = np.cumsum(weights) / weights.sum()
         
-        new_pos = random.choices(possible_positions, weights=probs, k=1)[0]
+        new_pos = min(int(np.searchsorted(cum_probs, uniforms[it], side="right")), len(windows) - 1)
         motifs[idx] = seq[new_pos:new_pos + motif_length]
+        motif_codes[idx] = windows[new_pos]
+        counts = other_counts + motifs_to_counts([motifs[idx]])
         
-        pwm = build_pwm(motifs)
-        current_score = sum(score_motif(m, pwm, background) for m in motifs)
+        pwm = pwm_from_counts(counts, n_motifs)
+        current_score = float(score_motif(motif_codes, log_odds_matrix(pwm, bg_arr)).sum())
         if current_score > best_score:
             best_score = current_score
             best_motifs = motifs[:]
+            best_pwm = pwm
     
-    return best_motifs, best_score
+    return best_motifs, best_score, best_pwm
 
 # Estimate maximum motif length
 def estimate_max_motif_length(sequences: List[str], max_test_length: int = 20, iterations: int = 50) -> int:
@@ -110,23 +130,29 @@ def estimate_max_motif_length(sequences: List[str], max_test_length: int = 20, i
     
     best_length = 4
     best_score = -float("inf")
+    rng = np.random.default_rng()
     
     # Test lengths from 4 to max_length
     for length in range(4, max_length + 1):
-        motifs, score = gibbs_sampling(sequences, length, iterations=iterations)
+        motifs, score, _ = gibbs_sampling(sequences, length, iterations=iterations, rng=rng)
         if motifs and score > best_score:
             best_score = score
             best_length = length
     
     return best_length
 
-# Generate consensus from motifs
-def motifs_to_consensus(motifs: List[str]) -> str:
+# Generate consensus from motifs, reading majority bases straight from their PWM when available
+def motifs_to_consensus(motifs: List[str], pwm: Optional[np.ndarray] = None) -> str:
     if not motifs:
         return ""
     motif_length = len(motifs[0])
     consensus = []
     for pos in range(motif_length):
+        # Above 0.5 the base is a strict majority, so no tie or non-ACGT base can beat it;
+        # otherwise recount so ties keep most_common's first-seen order
+        if pwm is not None and pwm[pos].max() > 0.5:
+            consensus.append(BASES[int(pwm[pos].argmax())])
+            continue
         bases = Counter(motif[pos] for motif in motifs)
         consensus.append(bases.most_common(1)[0][0])
     return "".join(consensus)
@@ -29,7 +29,7 @@ async def align(request: AlignRequest):
         HTTPException: For invalid inputs or API errors.
     """
     try:
-        alignment = align_sequences(request.sequences, request.seq_type)
+        alignment = await align_sequences(request.sequences, request.seq_type)
         if alignment is None:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1,8 +1,25 @@
-import time
-import requests
+import asyncio
+import httpx
 from typing import Optional
 
-def align_sequences(sequences: str, seq_type: str, email: str = "user@example.com") -> Optional[str]:
+BASE_URL = "https://www.ebi.ac.uk/Tools/services/rest/clustalo"
+POLL_TIMEOUT = 600  # seconds to wait for a submitted job
+MAX_POLL_DELAY = 30.0
+# Per-operation limits for each EBI call; httpx's 5 s default is too tight for
+# submitting large inputs or downloading big alignments. POLL_TIMEOUT bounds the overall wait.
+REQUEST_TIMEOUT = httpx.Timeout(120.0, connect=10.0)
+
+
+async def _wait_for_job(client: httpx.AsyncClient, job_id: str) -> None:
+    """Poll the job status with exponential backoff until it stops running."""
+    status_url = f"{BASE_URL}/status/{job_id}"
+    delay = 1.0
+    while (await client.get(status_url)).text == "RUNNING":
+        await asyncio.sleep(delay)
+        delay = min(delay * 1.5, MAX_POLL_DELAY)
+
+
+async def align_sequences(sequences: str, seq_type: str, email: str = "user@example.com") -> Optional[str]:
     """
     Align sequences using Clustal Omega API.
     
@@ -22,26 +39,26 @@ def align_sequences(sequences: str, seq_type: str, email: str = "user@example.co
         raise ValueError("Sequences cannot be empty")
     if seq_type not in ["dna", "protein"]:
         raise ValueError("Sequence type must be 'dna' or 'protein'")
-    
-    base_url = "https://www.ebi.ac.uk/Tools/services/rest/clustalo"
+
     try:
-        # Submit job
-        data = {"email": email, "sequence": sequences, "stype": seq_type}
-        response = requests.post(f"{base_url}/run", data=data)
-        response.raise_for_status()
-        job_id = response.text
-
-        # Poll status
-        status_url = f"{base_url}/status/{job_id}"
-        while requests.get(status_url).text == "RUNNING":
-            time.sleep(5)
-
-        # Get result
-        result_url = f"{base_url}/result/{job_id}/aln-clustal_num"
-        result = requests.get(result_url)
-        result.raise_for_status()
-        return result.text
-    except requests.RequestException as e:
+        async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
+            # Submit job
+            data = {"email": email, "sequence": sequences, "stype": seq_type}
+            response = await client.post(f"{BASE_URL}/run", data=data)
+            response.raise_for_status()
+            job_id = response.text
+
+            # Poll status
+            await asyncio.wait_for(_wait_for_job(client, job_id), timeout=POLL_TIMEOUT)
+
+            # Get result
+            result_url = f"{BASE_URL}/result/{job_id}/aln-clustal_num"
+            result = await client.get(result_url)
+            result.raise_for_status()
+            return result.text
+    except asyncio.TimeoutError:
+        raise RuntimeError(f"Clustal Omega job did not finish within {POLL_TIMEOUT} seconds")
+    except httpx.HTTPError as e:
         raise RuntimeError(f"Clustal Omega API error: {str(e)}")
     except Exception as e:
-        raise RuntimeError(f"Alignment failed: {str(e)}")
\ No newline at end of file
+        raise RuntimeError(f"Alignment failed: {str(e)}")
@@ -10,6 +10,9 @@ class MusicResponse(BaseModel):
 
 router = APIRouter(prefix="/musicdna")
 
+# Compile the numba melody walk at import so the first request doesn't pay for it
+functions.warmup()
+
 @router.post("/", response_model=MusicResponse)
 def musicdna(request: Sequence):
     if not request.sequence.strip():
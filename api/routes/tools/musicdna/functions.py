@@ -1,26 +1,32 @@
+from functools import lru_cache
+
 import numpy as np
+from numba import njit
 
-def generate_sine_wave(frequency, duration, sample_rate=44100):
-    t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
-    wave = np.sin(2 * np.pi * frequency * t)
-    return wave
+MELODY_SCALE = [261.63, 293.66, 329.63, 349.23, 392.00, 440.00, 493.88, 523.25]  # C4 to C5
+CHORD_SCALE = [130.81, 146.83, 164.81, 174.61, 196.00, 220.00, 246.94, 261.63]  # C3 to C4
+STRIP_WHITESPACE = str.maketrans("", "", " \t\n\r\v\f")
 
-def combine_waves(waves):
-    return np.concatenate(waves)
+# Simplified chord (root, third, fifth) for every melody note
+_CHORD_TABLE = {
+    freq: tuple(CHORD_SCALE[i % 7] for i in (index, index + 2, index + 4))
+    for index, freq in enumerate(MELODY_SCALE)
+}
+
+@lru_cache(maxsize=32)
+def _time_axis(duration, sample_rate):
+    # Shared sample times for a given duration; read-only since every caller gets the same array
+    t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
+    t.setflags(write=False)
+    return t
 
 def sequence_validator(sequence):
-    sequence = sequence.upper()
     if sequence[0] == ">":
-        sequence = sequence.splitlines()
-        sequence = sequence[1:]
-        sequence = "".join(sequence).strip()
-    else:
-        sequence = sequence.splitlines()
-        sequence = "".join(sequence).strip()
-    return sequence
+        sequence = sequence.partition("\n")[2]
+    return sequence.translate(STRIP_WHITESPACE).upper()
 
 def is_dna(sequence):
-    return set(sequence).issubset({"A", "C", "G", "T"})
+    return sequence.isascii() and not sequence.encode().translate(None, b"ACGT")
 
 def get_next_index(current_index, step, scale_length):
     new_index = current_index + step
@@ -30,56 +36,56 @@ def get_next_index(current_index, step, scale_length):
         new_index = 2 * (scale_length - 1) - new_index  # Reflect at upper bound
     return new_index
 
+@njit(cache=True)
+def _walk_scale(codes, transitions, start_index):
+    indices = np.empty(len(codes), dtype=np.uint8)
+    current_index = start_index
+    for k in range(len(codes)):
+        current_index = transitions[codes[k], current_index]
+        indices[k] = current_index
+    return indices
+
 def melody_maker(sequence):
-    melody_scale = [261.63, 293.66, 329.63, 349.23, 392.00, 440.00, 493.88, 523.25]  # C4 to C5
     step_mapping = {'A': 1, 'T': -1, 'C': 2, 'G': -2}
-    current_index = 0
-    scale_length = len(melody_scale)
-    melody_freq = []
-
-    for nucleotide in sequence:
-        if nucleotide in step_mapping:
-            step = step_mapping[nucleotide]
-            current_index = get_next_index(current_index, step, scale_length)
-            melody_freq.append(melody_scale[current_index])
-
-    return melody_freq
-
-def get_chord_freqs(melody_freq, melody_scale, chord_scale):
-    try:
-        index = melody_scale.index(melody_freq)
-    except ValueError:
-        index = min(range(len(melody_scale)), key=lambda i: abs(melody_scale[i] - melody_freq))
-    # Simplified chord: root, third, fifth
-    chord_indices = [index % 7, (index + 2) % 7, (index + 4) % 7]
-    chord_freqs = [chord_scale[i] for i in chord_indices]
-    return chord_freqs
-
-def generate_chord_wave(chord_freqs, duration, sample_rate=44100):
-    t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
-    chord_wave = sum(np.sin(2 * np.pi * freq * t) for freq in chord_freqs)
-    return chord_wave / len(chord_freqs)  # Normalize
-
-def generate_combined_wave(melody_freq, chunk_size=4, duration_per_note=0.25, sample_rate=44100):
-    melody_scale = [261.63, 293.66, 329.63, 349.23, 392.00, 440.00, 493.88, 523.25]  # C4 to C5
-    chord_scale = [130.81, 146.83, 164.81, 174.61, 196.00, 220.00, 246.94, 261.63]  # C3 to C4
-    combined_waves = []
+    scale_length = len(MELODY_SCALE)
 
-    for i in range(0, len(melody_freq), chunk_size):
-        chunk = melody_freq[i:i + chunk_size]
-        if not chunk:
-            break
+    # transitions[c, i]: scale index reached from index i on the c-th nucleotide of step_mapping
+    transitions = np.array(
+        [[get_next_index(i, step, scale_length) for i in range(scale_length)] for step in step_mapping.values()],
+        dtype=np.uint8,
+    )
+    lut = np.full(256, 255, dtype=np.uint8)
+    for code, nucleotide in enumerate(step_mapping):
+        lut[ord(nucleotide)] = code
+    codes = lut[np.frombuffer(sequence.encode("ascii", "replace"), dtype=np.uint8)]
+    codes = codes[codes != 255]  # Nucleotides without a step are skipped
 
-        # Generate melody wave for chunk
-        melody_wave_chunk = np.concatenate([generate_sine_wave(freq, duration_per_note, sample_rate) for freq in chunk])
+    return np.asarray(MELODY_SCALE)[_walk_scale(codes, transitions, 0)]
 
-        # Generate chord wave based on first note
-        chord_freqs = get_chord_freqs(chunk[0], melody_scale, chord_scale)
-        chunk_duration = len(chunk) * duration_per_note
-        chord_wave = generate_chord_wave(chord_freqs, chunk_duration, sample_rate)
+def warmup():
+    melody_maker("ACGT")
 
-        # Mix and normalize
-        combined_wave = (melody_wave_chunk + chord_wave) / 2
-        combined_waves.append(combined_wave)
-
-    return np.concatenate(combined_waves)
\ No newline at end of file
+def generate_combined_wave(melody_freq, chunk_size=4, duration_per_note=0.25, sample_rate=44100):
+    if len(melody_freq) == 0:
+        return np.array([])
+
+    samples_per_note = int(sample_rate * duration_per_note)
+    n_samples = len(melody_freq) * samples_per_note
+
+    # Melody: every note restarts its phase and the scale has few distinct pitches,
+    # so synthesize each distinct note once and gather
+    t_note = _time_axis(duration_per_note, sample_rate)
+    notes, note_idx = np.unique(np.asarray(melody_freq, dtype=np.float64), return_inverse=True)
+    note_waves = np.sin(2 * np.pi * notes[:, None] * t_note)
+    melody_wave = note_waves[note_idx].ravel()
+
+    # Chords: one triad per chunk, based on the chunk's first note
+    chunk_samples = chunk_size * samples_per_note
+    t_chunk = np.linspace(0, chunk_size * duration_per_note, chunk_samples, endpoint=False)
+    chord_freqs = np.array([_CHORD_TABLE[freq] for freq in melody_freq[::chunk_size]])
+    chords, chord_idx = np.unique(chord_freqs, axis=0, return_inverse=True)
+    chord_waves = np.sin(2 * np.pi * chords[:, :, None] * t_chunk).sum(axis=1) / chords.shape[1]  # Normalize
+    chord_wave = chord_waves[chord_idx.ravel()].ravel()[:n_samples]
+
+    # Mix and normalize
+    return (melody_wave + chord_wave) / 2
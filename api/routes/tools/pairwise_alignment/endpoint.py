@@ -7,6 +7,9 @@ router = APIRouter(
     prefix="/pairwise_alignment",
 )
 
+# Compile the numba DP kernels at import so the first request doesn't pay for it
+functions.warmup()
+
 
 class PairwiseAlignment(BaseModel):
     sequence1: str
@@ -30,9 +33,9 @@ def pairwise_alignment(request: PairwiseAlignment):
                 path_matrix = functions.lcs_global(seq1, seq2, matrix)
                 results = functions.global_alignment(seq1, seq2, path_matrix, matrix)
             elif alignment_type == "Local_Alignment":
-                score_matrix, path_matrix = functions.lcs_local(seq1, seq2, matrix)
+                start, path_matrix = functions.lcs_local(seq1, seq2, matrix)
                 results = functions.local_alignment(
-                    seq1, seq2, score_matrix, path_matrix, matrix
+                    seq1, seq2, start, path_matrix, matrix
                 )
             # similarity = round(results[0]/(results[0]+results[2]+results[3])*100)
             df = functions.table(sequence1, sequence2)
@@ -1,18 +1,26 @@
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
 import altair as alt
+from numba import njit
+
+# Directions stored in the uint8 path matrices
+DIAG = 0  # "\\"
+LEFT = 1  # "-"
+UP = 2  # "|"
+STOP = 3  # end of a local alignment
+
+STRIP_WHITESPACE = str.maketrans("", "", " \t\n\r\v\f")
 
 
 def format_sequence(sequence):
-    sequence = sequence.upper()
     if sequence[0] == ">":
-        sequence = sequence.splitlines()[1:]
-        sequence = "".join(sequence).strip()
-    else:
-        sequence = "".join(sequence.splitlines()).strip()
-    return sequence
+        sequence = sequence.partition("\n")[2]
+    return sequence.translate(STRIP_WHITESPACE).upper()
 
 def is_dna(seq):
-    return set(seq).issubset({"A", "C", "G", "T"})
+    return seq.isascii() and not seq.encode().translate(None, b"ACGT")
 
 
 def matrix_subs():
@@ -25,98 +33,133 @@ def matrix_subs():
     }
 
 
-def calculate_score(base1, base2, matrix):
-    j = matrix["col"].index(base1)
-    return matrix[base2][j]
+def pair_scores(matrix_subs):
+    cols = matrix_subs["col"]
+    return {
+        (base1, base2): matrix_subs[base2][j]
+        for j, base1 in enumerate(cols)
+        for base2 in cols
+    }
 
 
-def maximum_score(base1, base2, side, top, diagonal):
-    if (base1 == base2) and (diagonal >= side) and (diagonal >= top):
-        return diagonal
-    elif (base1 != base2) and (diagonal >= side) and (diagonal >= top):
-        return diagonal
-    elif (side >= top) and (side >= diagonal):
-        return side
-    return top
+def encode_sequence(seq, matrix_subs):
+    lut = np.zeros(256, dtype=np.uint8)
+    for code, base in enumerate(matrix_subs["col"]):
+        lut[ord(base)] = code
+    return lut[np.frombuffer(seq.encode("ascii"), dtype=np.uint8)]
 
 
-def create_path(base1, base2, side, top, diagonal):
-    if (base1 == base2) and (diagonal >= side) and (diagonal >= top):
-        return "\\"
-    elif (base1 != base2) and (diagonal >= side) and (diagonal >= top):
-        return "\\"
-    elif (side >= top) and (side >= diagonal):
-        return "-"
-    return "|"
+def substitution_array(matrix_subs):
+    return np.array(
+        [[matrix_subs[base2][code1] for base2 in matrix_subs["col"]]
+         for code1 in range(len(matrix_subs["col"]))],
+        dtype=np.int32,
+    )
 
 
-def lcs_global(seq1, seq2, matrix_subs):
-    score = []
-    path = []
-    g = -3
-
-    for i in range(0, len(seq1)):
-        score.append([0] * len(seq2))
-        path.append([""] * len(seq2))
+@njit(inline="always")
+def _best_move(diagonal, side, top):
+    # Ties prefer the diagonal, then the left move
+    if diagonal >= side and diagonal >= top:
+        return diagonal, DIAG
+    if side >= top:
+        return side, LEFT
+    return top, UP
+
+
+@njit(cache=True)
+def _lcs_global_kernel(s1, s2, sub, g):
+    m, n = len(s1), len(s2)
+    path = np.zeros((m, n), dtype=np.uint8)
+    if m == 0 or n == 0:
+        return path
+
+    for i in range(m):
+        path[i, 0] = UP
+    for j in range(n):
+        path[0, j] = LEFT
+
+    # Only the previous and current score rows are kept; the traceback reads path alone
+    prev = np.empty(n, dtype=np.int32)
+    curr = np.empty(n, dtype=np.int32)
+    for j in range(n):
+        prev[j] = g * j
+
+    for i in range(1, m):
+        curr[0] = g * i
+        for j in range(1, n):
+            diagonal = prev[j - 1] + sub[s1[i], s2[j]]
+            side = curr[j - 1] + g
+            top = prev[j] + g
+
+            curr[j], path[i, j] = _best_move(diagonal, side, top)
+        prev, curr = curr, prev
 
-    for i in range(0, len(seq1)):
-        score[i][0] = g * i
-        path[i][0] = "|"
-    for j in range(0, len(seq2)):
-        score[0][j] = g * j
-        path[0][j] = "-"
+    return path
 
-    for i in range(1, len(seq1)):
-        for j in range(1, len(seq2)):
-            base1 = seq1[i]
-            base2 = seq2[j]
-            s = calculate_score(base1, base2, matrix_subs)
 
-            side = score[i][j - 1]
-            top = score[i - 1][j]
-            diagonal = score[i - 1][j - 1]
+@njit(cache=True)
+def _lcs_local_kernel(s1, s2, sub, g):
+    m, n = len(s1), len(s2)
+    # Cells scoring 0 end the traceback, so they are marked STOP instead of keeping a score matrix
+    path = np.full((m, n), STOP, dtype=np.uint8)
+    best_i, best_j, best_score = 0, 0, 0
+    if m == 0 or n == 0:
+        return (best_i, best_j), path
 
-            score[i][j] = maximum_score(base1, base2, side + g, top + g, diagonal + s)
-            path[i][j] = create_path(base1, base2, side + g, top + g, diagonal + s)
+    prev = np.zeros(n, dtype=np.int32)
+    curr = np.zeros(n, dtype=np.int32)
 
-    return path
+    for i in range(1, m):
+        for j in range(1, n):
+            diagonal = prev[j - 1] + sub[s1[i], s2[j]]
+            side = curr[j - 1] + g
+            top = prev[j] + g
 
+            best, move = _best_move(diagonal, side, top)
+            if best > 0:
+                curr[j] = best
+                path[i, j] = move
+                # First highest cell in row-major order starts the traceback
+                if best > best_score:
+                    best_i, best_j, best_score = i, j, best
+            else:
+                curr[j] = 0
+        prev, curr = curr, prev
 
-def lcs_local(seq1, seq2, matrix_subs):
-    score = []
-    path = []
-    g = -3
+    return (best_i, best_j), path
 
-    for i in range(0, len(seq1)):
-        score.append([0] * len(seq2))
-        path.append([""] * len(seq2))
 
-    for i in range(0, len(seq1)):
-        path[i][0] = "|"
-    for j in range(0, len(seq2)):
-        path[0][j] = "-"
+def lcs_global(seq1, seq2, matrix_subs):
+    g = -3
+    return _lcs_global_kernel(
+        encode_sequence(seq1, matrix_subs),
+        encode_sequence(seq2, matrix_subs),
+        substitution_array(matrix_subs),
+        g,
+    )
 
-    for i in range(1, len(seq1)):
-        for j in range(1, len(seq2)):
-            base1 = seq1[i]
-            base2 = seq2[j]
-            s = calculate_score(base1, base2, matrix_subs)
 
-            side = score[i][j - 1]
-            top = score[i - 1][j]
-            diagonal = score[i - 1][j - 1]
+def lcs_local(seq1, seq2, matrix_subs):
+    g = -3
+    return _lcs_local_kernel(
+        encode_sequence(seq1, matrix_subs),
+        encode_sequence(seq2, matrix_subs),
+        substitution_array(matrix_subs),
+        g,
+    )
 
-            score[i][j] = max(
-                0, maximum_score(base1, base2, side + g, top + g, diagonal + s)
-            )
-            path[i][j] = create_path(base1, base2, side + g, top + g, diagonal + s)
 
-    return score, path
+def warmup():
+    matrix = matrix_subs()
+    lcs_global("ACGT", "AGT", matrix)
+    lcs_local("ACGT", "AGT", matrix)
 
 
 def global_alignment(seq1, seq2, matrix_path, matrix_subs):
-    ali_seq1 = ""
-    ali_seq2 = ""
+    scores = pair_scores(matrix_subs)
+    ali_seq1 = []
+    ali_seq2 = []
     g = -3
     match = 0
     mismatch = 0
@@ -127,131 +170,113 @@ def global_alignment(seq1, seq2, matrix_path, matrix_subs):
     j = len(seq2) - 1
 
     while (i != 0) or (j != 0):
-        s = calculate_score(seq1[i], seq2[j], matrix_subs)
+        s = scores[seq1[i], seq2[j]]
 
-        if matrix_path[i][j] == "\\" and seq1[i] == seq2[j]:
-            ali_seq1 = seq1[i] + ali_seq1
-            ali_seq2 = seq2[j] + ali_seq2
+        if matrix_path[i, j] == DIAG and seq1[i] == seq2[j]:
+            ali_seq1.append(seq1[i])
+            ali_seq2.append(seq2[j])
             match += 1
             score_final += s
             i -= 1
             j -= 1
 
-        elif matrix_path[i][j] == "\\" and seq1[i] != seq2[j]:
-            ali_seq1 = seq1[i] + ali_seq1
-            ali_seq2 = seq2[j] + ali_seq2
+        elif matrix_path[i, j] == DIAG and seq1[i] != seq2[j]:
+            ali_seq1.append(seq1[i])
+            ali_seq2.append(seq2[j])
             mismatch += 1
             score_final += s
             i -= 1
             j -= 1
 
-        elif matrix_path[i][j] == "-":
-            ali_seq1 = " - " + ali_seq1
-            ali_seq2 = seq2[j] + ali_seq2
+        elif matrix_path[i, j] == LEFT:
+            ali_seq1.append(" - ")
+            ali_seq2.append(seq2[j])
             gap += 1
             score_final += g
             j -= 1
 
-        elif matrix_path[i][j] == "|":
-            ali_seq1 = seq1[i] + ali_seq1
-            ali_seq2 = " - " + ali_seq2
+        elif matrix_path[i, j] == UP:
+            ali_seq1.append(seq1[i])
+            ali_seq2.append(" - ")
             gap += 1
             score_final += g
             i -= 1
 
+    ali_seq1 = "".join(reversed(ali_seq1))
+    ali_seq2 = "".join(reversed(ali_seq2))
     return match, mismatch, gap, score_final, ali_seq1, ali_seq2
 
 
-def find_highest_value(seq1, matrix):
-    highest_value_matrix = 0
-
-    for i in range(len(seq1)):
-        highest_value_in_line = max(matrix[i])
-        if highest_value_in_line > highest_value_matrix:
-            highest_value_matrix = highest_value_in_line
-            line = i
-
-    column = matrix[line].index(highest_value_matrix)
-    return line, column
-
-
-def local_alignment(seq1, seq2, score_matrix, matrix_path, matrix_subs):
-    ali_seq1 = ""
-    ali_seq2 = ""
+def local_alignment(seq1, seq2, start, matrix_path, matrix_subs):
+    scores = pair_scores(matrix_subs)
+    ali_seq1 = []
+    ali_seq2 = []
     g = -3
     match = 0
     mismatch = 0
     gap = 0
     score_final = 0
 
-    i, j = find_highest_value(seq1, score_matrix)
-    value = score_matrix[i][j]
+    i, j = start
 
-    while value > 0:
-        s = calculate_score(seq1[i], seq2[j], matrix_subs)
+    while matrix_path[i, j] != STOP:
+        s = scores[seq1[i], seq2[j]]
 
-        if matrix_path[i][j] == "\\" and seq1[i] == seq2[j]:
-            ali_seq1 = seq1[i] + ali_seq1
-            ali_seq2 = seq2[j] + ali_seq2
+        if matrix_path[i, j] == DIAG and seq1[i] == seq2[j]:
+            ali_seq1.append(seq1[i])
+            ali_seq2.append(seq2[j])
             match += 1
             score_final += s
             i -= 1
             j -= 1
-            value = score_matrix[i][j]
 
-        elif matrix_path[i][j] == "\\" and seq1[i] != seq2[j]:
-            ali_seq1 = seq1[i] + ali_seq1
-            ali_seq2 = seq2[j] + ali_seq2
+        elif matrix_path[i, j] == DIAG and seq1[i] != seq2[j]:
+            ali_seq1.append(seq1[i])
+            ali_seq2.append(seq2[j])
             mismatch += 1
             score_final += s
             i -= 1
             j -= 1
-            value = score_matrix[i][j]
 
-        elif matrix_path[i][j] == "-":
-            ali_seq1 = " - " + ali_seq1
-            ali_seq2 = seq2[j] + ali_seq2
+        elif matrix_path[i, j] == LEFT:
+            ali_seq1.append(" - ")
+            ali_seq2.append(seq2[j])
             gap += 1
             score_final += g
             j -= 1
-            value = score_matrix[i][j]
 
-        elif matrix_path[i][j] == "|":
-            ali_seq1 = seq1[i] + ali_seq1
-            ali_seq2 = " - " + ali_seq2
+        elif matrix_path[i, j] == UP:
+            ali_seq1.append(seq1[i])
+            ali_seq2.append(" - ")
             gap += 1
             score_final += g
             i -= 1
-            value = score_matrix[i][j]
 
+    ali_seq1 = "".join(reversed(ali_seq1))
+    ali_seq2 = "".join(reversed(ali_seq2))
     return match, mismatch, gap, score_final, ali_seq1, ali_seq2
 
 
+# table() and bar_chart() both count the same two sequences per request
+@lru_cache(maxsize=32)
+def base_counts(sequence):
+    counts = np.bincount(
+        np.frombuffer(sequence.upper().encode("utf-8"), dtype=np.uint8), minlength=256
+    )
+    return {base: int(counts[ord(base)]) for base in "AGCT"}
+
+
 def dataframe(sequence1, sequence2):
     try:
+        counts1 = base_counts(sequence1)
+        counts2 = base_counts(sequence2)
         return dict(
             [
-                ("A ", [sequence1.upper().count("A"), sequence2.upper().count("A")]),
-                ("G ", [sequence1.upper().count("G"), sequence2.upper().count("G")]),
-                ("C ", [sequence1.upper().count("C"), sequence2.upper().count("C")]),
-                ("T ", [sequence1.upper().count("T"), sequence2.upper().count("T")]),
-                (
-                    "Total",
-                    [
-                        (
-                            sequence1.upper().count("A")
-                            + sequence1.upper().count("G")
-                            + sequence1.upper().count("C")
-                            + sequence1.upper().count("T")
-                        ),
-                        (
-                            sequence2.upper().count("A")
-                            + sequence2.upper().count("G")
-                            + sequence2.upper().count("C")
-                            + sequence2.upper().count("T")
-                        ),
-                    ],
-                ),
+                ("A ", [counts1["A"], counts2["A"]]),
+                ("G ", [counts1["G"], counts2["G"]]),
+                ("C ", [counts1["C"], counts2["C"]]),
+                ("T ", [counts1["T"], counts2["T"]]),
+                ("Total", [sum(counts1.values()), sum(counts2.values())]),
             ]
         )
     except ZeroDivisionError:
@@ -268,16 +293,18 @@ def table(sequence1, sequence2):
 
 
 def bar_chart(sequence1, sequence2):
+    counts1 = base_counts(sequence1)
+    counts2 = base_counts(sequence2)
     ds = pd.DataFrame(
         [
-            ["A", sequence1.upper().count("A"), "seq1"],
-            ["C", sequence1.upper().count("C"), "seq1"],
-            ["G", sequence1.upper().count("G"), "seq1"],
-            ["T", sequence1.upper().count("T"), "seq1"],
-            ["A", sequence2.upper().count("A"), "seq2"],
-            ["C", sequence2.upper().count("C"), "seq2"],
-            ["G", sequence2.upper().count("G"), "seq2"],
-            ["T", sequence2.upper().count("T"), "seq2"],
+            ["A", counts1["A"], "seq1"],
+            ["C", counts1["C"], "seq1"],
+            ["G", counts1["G"], "seq1"],
+            ["T", counts1["T"], "seq1"],
+            ["A", counts2["A"], "seq2"],
+            ["C", counts2["C"], "seq2"],
+            ["G", counts2["G"], "seq2"],
+            ["T", counts2["T"], "seq2"],
         ],
         columns=["Nucleotide", "Percentage_Count", "Sequences"],
     )
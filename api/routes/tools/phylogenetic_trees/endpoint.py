@@ -5,6 +5,9 @@ router = APIRouter(
     prefix="/phylogenetic_trees",
 )
 
+# Compile the numba Hamming kernel at import so the first request doesn't pay for it
+functions.warmup()
+
 @router.post("/")
 def build_phylogenetic_tree(fasta: str):
     try:
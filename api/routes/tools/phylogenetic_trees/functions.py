@@ -1,21 +1,39 @@
 import numpy as np
 from fastapi import HTTPException
+from numba import njit
+
+@njit(cache=True)
+def _hamming_matrix(seq_mat):
+    n, seq_length = seq_mat.shape
+    dist_matrix = np.zeros((n, n))
+    for i in range(n):
+        for j in range(i + 1, n):
+            diff = 0
+            for k in range(seq_length):
+                if seq_mat[i, k] != seq_mat[j, k]:
+                    diff += 1
+            dist = diff / seq_length
+            dist_matrix[i, j] = dist
+            dist_matrix[j, i] = dist
+    return dist_matrix
 
 # Function to compute Hamming distance matrix
 def compute_distance_matrix(fasta_input):
     lines = fasta_input.strip().split("\n")
     sequences = {}
-    current_seq = ""
+    current_parts = []
     current_name = None
     
     for line in lines:
         if line.startswith(">"):
+            current_seq = "".join(current_parts)
             if current_name and current_seq:
                 sequences[current_name] = current_seq
             current_name = line[1:].strip()
-            current_seq = ""
+            current_parts = []
         else:
-            current_seq += line.strip()
+            current_parts.append(line.strip())
+    current_seq = "".join(current_parts)
     if current_name and current_seq:
         sequences[current_name] = current_seq
     
@@ -27,16 +45,16 @@ def compute_distance_matrix(fasta_input):
     n = len(seqs)
     
     seq_length = len(seqs[0])
-    # if not all(len(seq) == seq_length for seq in seqs):
-    #     raise HTTPException(status_code=400, detail="All sequences must be the same length")
+    if not all(len(seq) == seq_length for seq in seqs):
+        raise HTTPException(status_code=400, detail="All sequences must be the same length")
     
-    dist_matrix = np.zeros((n, n))
-    for i in range(n):
-        for j in range(i + 1, n):
-            diff = sum(a != b for a, b in zip(seqs[i], seqs[j]))
-            dist = diff / seq_length
-            dist_matrix[i, j] = dist
-            dist_matrix[j, i] = dist
+    # One contiguous (n, seq_length) byte matrix for the distance kernel
+    try:
+        seq_mat = np.frombuffer("".join(seqs).encode("ascii"), dtype=np.uint8).reshape(n, seq_length)
+    except UnicodeEncodeError:
+        raise HTTPException(status_code=400, detail="Sequences must only contain ASCII characters")
+
+    dist_matrix = _hamming_matrix(seq_mat)
     
     return dist_matrix, names
 
@@ -47,22 +65,22 @@ def neighbor_joining(dist_matrix, names):
         return None
     
     nodes = [f"{name}:0" for name in names]
-    matrix = dist_matrix.copy()
+    # Distances of the remaining nodes live in the top-left n x n block of one buffer
+    buffer = dist_matrix.copy()
     
     while n > 2:
-        Q = np.zeros((n, n))
-        for i in range(n):
-            for j in range(i + 1, n):
-                total_dist = sum(matrix[i]) + sum(matrix[j]) - 2 * matrix[i, j]
-                Q[i, j] = (n - 2) * matrix[i, j] - total_dist
-                Q[j, i] = Q[i, j]
+        matrix = buffer[:n, :n]
+        # Sequential row sums, so near-tied Q entries round the same way as a plain sum()
+        row_sums = np.cumsum(matrix, axis=1)[:, -1]
+        Q = (n - 2) * matrix - (row_sums[:, None] + row_sums[None, :] - 2 * matrix)
+        np.fill_diagonal(Q, np.inf)
         
         i, j = np.unravel_index(np.argmin(Q), Q.shape)
         if i > j:
             i, j = j, i
         
-        total_dist_i = sum(matrix[i]) / (n - 2)
-        total_dist_j = sum(matrix[j]) / (n - 2)
+        total_dist_i = row_sums[i] / (n - 2)
+        total_dist_j = row_sums[j] / (n - 2)
         d_ij = matrix[i, j]
         branch_i = (d_ij + total_dist_i - total_dist_j) / 2
         branch_j = d_ij - branch_i
@@ -72,18 +90,21 @@ def neighbor_joining(dist_matrix, names):
         nodes.pop(i)
         nodes.append(new_node)
         
-        new_dist = np.zeros((n - 1))
-        for k in range(n):
-            if k != i and k != j:
-                new_dist[k if k < i else (k - 1 if k < j else k - 2)] = (matrix[i, k] + matrix[j, k] - d_ij) / 2
+        new_dist = np.delete((matrix[i] + matrix[j] - d_ij) / 2, [i, j])
         
+        # Close the gaps left by rows/columns j and i, then put the merged node last
+        for k in (j, i):
+            buffer[k:n - 1, :n] = buffer[k + 1:n, :n]
+            buffer[:n, k:n - 1] = buffer[:n, k + 1:n]
         n -= 1
-        matrix = np.delete(matrix, [i, j], axis=0)
-        matrix = np.delete(matrix, [i, j], axis=1)
-        matrix = np.vstack([matrix, new_dist[:-1]])
-        matrix = np.hstack([matrix, new_dist[:, None]])
+        buffer[n - 1, :n - 1] = new_dist
+        buffer[:n - 1, n - 1] = new_dist
+        buffer[n - 1, n - 1] = 0.0
     
     if n == 2:
-        return f"({nodes[0]}:{matrix[0, 1]/2:.4f},{nodes[1]}:{matrix[0, 1]/2:.4f});"
+        return f"({nodes[0]}:{buffer[0, 1]/2:.4f},{nodes[1]}:{buffer[0, 1]/2:.4f});"
     return nodes[0] + ";"
-    
\ No newline at end of file
+    
+
+def warmup():
+    compute_distance_matrix(">a\nACGT\n>b\nAGGT")
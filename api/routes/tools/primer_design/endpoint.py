@@ -9,10 +9,10 @@ router = APIRouter(prefix="/primer_design")
 class PrimerRequest(BaseModel):
     sequence: str
     primer_len: int = 20
-    tm_min: int = 50
-    tm_max: int = 65
-    gc_min: int = 40
-    gc_max: int = 60
+    tm_min: float = 50
+    tm_max: float = 65
+    gc_min: float = 40
+    gc_max: float = 60
 
 
 @router.post("/")
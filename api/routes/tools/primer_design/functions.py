@@ -1,43 +1,42 @@
-import re
+import numpy as np
 
-def gc_content(seq):
-    gc = seq.count('G') + seq.count('C')
-    return gc / len(seq) * 100
-
-def melting_temp(seq):
-    # Wallace rule: Tm = 2(A+T) + 4(G+C)
-    a = seq.count('A')
-    t = seq.count('T')
-    g = seq.count('G')
-    c = seq.count('C')
-    return 2 * (a + t) + 4 * (g + c)
+COMPLEMENT = str.maketrans('ACGT', 'TGCA')
+NON_ATGC = bytes(c for c in range(256) if chr(c) not in 'ATGC')
 
 def reverse_complement(seq):
-    complement = {'A': 'T', 'T': 'A', 'G': 'C', 'C': 'G'}
-    return ''.join(complement[base] for base in reversed(seq))
+    return seq.translate(COMPLEMENT)[::-1]
+
+def window_stats(sequence, primer_len):
+    # GC content and Wallace Tm of every primer_len window, from a running G/C count
+    bases = np.frombuffer(sequence.encode('ascii'), dtype=np.uint8)
+    gc_running = np.concatenate(([0], np.cumsum((bases == ord('G')) | (bases == ord('C')))))
+    gc_count = gc_running[primer_len:] - gc_running[:-primer_len]
+    return gc_count / primer_len * 100, 2 * primer_len + 2 * gc_count
 
 def design_primers(sequence, primer_len=20, tm_min=50, tm_max=65, gc_min=40, gc_max=60):
     sequence = sequence.upper()
     # Remove any non-ATGC characters
-    sequence = re.sub(r'[^ATGC]', '', sequence)
+    sequence = sequence.encode('ascii', 'ignore').translate(None, NON_ATGC).decode('ascii')
 
-    for i in range(0, len(sequence) - primer_len * 2):
-        fwd = sequence[i:i+primer_len]
-        rev = reverse_complement(sequence[i+primer_len:i+primer_len*2])
+    n_windows = len(sequence) - primer_len * 2
+    if primer_len < 1 or n_windows < 1:
+        return None
 
-        fwd_gc = gc_content(fwd)
-        rev_gc = gc_content(rev)
-        fwd_tm = melting_temp(fwd)
-        rev_tm = melting_temp(rev)
+    gc, tm = window_stats(sequence, primer_len)
+    in_range = (gc_min <= gc) & (gc <= gc_max) & (tm_min <= tm) & (tm <= tm_max)
+    # The reverse primer for window i is the reverse complement of window i + primer_len,
+    # which has the same GC content and Tm
+    hits = np.flatnonzero(in_range[:n_windows] & in_range[primer_len:primer_len + n_windows])
+    if len(hits) == 0:
+        return None
 
-        if (gc_min <= fwd_gc <= gc_max and gc_min <= rev_gc <= gc_max and
-            tm_min <= fwd_tm <= tm_max and tm_min <= rev_tm <= tm_max):
-            return {
-                'forward_primer': fwd,
-                'reverse_primer': rev,
-                'forward_tm': fwd_tm,
-                'reverse_tm': rev_tm,
-                'forward_gc': fwd_gc,
-                'reverse_gc': rev_gc
-            }
-    return None
+    i = int(hits[0])
+    j = i + primer_len
+    return {
+        'forward_primer': sequence[i:j],
+        'reverse_primer': reverse_complement(sequence[j:j+primer_len]),
+        'forward_tm': int(tm[i]),
+        'reverse_tm': int(tm[j]),
+        'forward_gc': float(gc[i]),
+        'reverse_gc': float(gc[j])
+    }
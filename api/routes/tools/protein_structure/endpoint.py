@@ -1,4 +1,5 @@
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Header, HTTPException, Response, status
+from fastapi.responses import FileResponse, JSONResponse
 from pydantic import BaseModel
 from . import functions
 
@@ -26,9 +27,43 @@ async def predict_structure(request: PredictionRequest):
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=result["error"]
             )
-        return result
+        # Already plain JSON types; skip jsonable_encoder's walk over the PDB text and profile
+        return JSONResponse(result)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error predicting structure: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    # gzip must be explicitly (or via *) allowed with a non-zero q-value; "gzip;q=0" refuses it
+    qualities = {}
+    for coding in accept_encoding.lower().split(","):
+        name, _, params = coding.partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qualities[name.strip()] = q
+    return qualities.get("gzip", qualities.get("*", 0.0)) > 0
+
+@router.get("/pdb")
+async def mock_pdb(accept_encoding: str = Header(default="")):
+    """
+    Serve the mock PDB structure, pre-compressed when the client accepts gzip.
+    """
+    if _accepts_gzip(accept_encoding):
+        return Response(
+            content=functions.MOCK_PDB_GZIP,
+            media_type="chemical/x-pdb",
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+        )
+    return FileResponse(
+        functions.MOCK_PDB_PATH,
+        media_type="chemical/x-pdb",
+        headers={"Vary": "Accept-Encoding"},
+    )